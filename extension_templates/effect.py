@@ -44,6 +44,12 @@ deeper dive into how they influence the `_fit`, `_transform`, and `_predict` met
 - `capability:panel` (bool):
   - If `True`, your effect is expected to handle panel data (multiple time series) directly. `_fit` and `_transform` receive the full DataFrame with a MultiIndex.
   - If `False` (default), and panel data is provided, Prophetverse automatically broadcasts the effect, applying it to each time series individually.
+  - Per-series broadcasting clones the effect and calls `_predict` once per series,
+    each with its own parameters. If the parameters should be shared instead, set
+    the tag to `True`: `_predict` then receives all series at once, with a leading
+    series axis, and computes them in a single traced call. Write the computation
+    so that it broadcasts over that axis (the `@` product in `MyCustomEffect`
+    does), or map it over the axis with `jax.vmap` when it does not.
 
 - `capability:multivariate_input` (bool):
   - If `True`, your effect is expected to handle a DataFrame with multiple columns as input. `_fit` and `_transform` receive all matching columns at once.
@@ -85,20 +91,43 @@ deeper dive into how they influence the `_fit`, `_transform`, and `_predict` met
 from typing import Any, Dict, Optional
 
 import pandas as pd
+import jax
 import jax.numpy as jnp
 import numpyro
 import numpyro.distributions as dist
+from jax.typing import DTypeLike
 
 from prophetverse.effects.base import BaseEffect
-from prophetverse.utils.frame_to_array import series_to_tensor_or_array
+from prophetverse.utils.frame_to_array import series_to_tensor
+
+
+# Pure computations are kept in module-level jitted kernels, so that `_predict`
+# only samples parameters and calls the compiled function. Jit the kernel, not
+# the sampling code: `numpyro.sample` must stay visible to NumPyro's handlers.
+# The kernels receive every value they need as arguments and never touch
+# `self`, so they are cached by JAX across calls and `mcmc.run` invocations,
+# including with `jit_model_args=True`.
+@jax.jit
+def _simple_kernel(data, scale_factor, bias, variable):
+    return data * scale_factor + bias + variable
+
+
+@jax.jit
+def _custom_kernel(data, coef, multiplier):
+    # Contract the feature axis against the (n_features,) coefficients in a
+    # single matrix-vector product. The multiplier is folded into the
+    # coefficients first, so that the data is traversed only once.
+    return data @ (coef * multiplier).reshape((-1, 1))
 
 
 class MySimpleEffect(BaseEffect):
     """
-    A simple custom effect example that only overrides `_predict`.
+    A simple custom effect example that mostly overrides `_predict`.
 
     This template is suitable when no fitting or parameter sampling is required,
-    and the effect is a direct transformation of the input data.
+    and the effect is a direct transformation of the input data. `_transform`
+    only casts the output of the default implementation to `dtype` and adds a
+    leading series axis.
 
     Parameters
     ----------
@@ -106,6 +135,10 @@ class MySimpleEffect(BaseEffect):
         A scaling factor applied to the input data.
     bias : float
         A constant bias added to the scaled input.
+    dtype : DTypeLike
+        Floating point type of the transformed data, by default `jnp.float32`.
+        Single precision is enough for a linear combination of the inputs, and
+        halves the bytes moved per sample compared to `float64`.
     """
 
     _tags = {
@@ -117,14 +150,47 @@ class MySimpleEffect(BaseEffect):
         "requires_fit_before_transform": False,
     }
 
-    def __init__(self, scale_factor: float = 1.0, bias: float = 0.0):
+    def __init__(
+        self,
+        scale_factor: float = 1.0,
+        bias: float = 0.0,
+        dtype: DTypeLike = jnp.float32,
+    ):
         # Init hyperparameters before BaseEffect init
         # Do not change them!
         self.scale_factor = scale_factor
         self.bias = bias
+        self.dtype = dtype
         super().__init__()
 
         # Now, do parameter handling
+        # Keep the hyperparameters as device arrays of the effect's dtype, so that
+        # they are not uploaded as weakly-typed Python floats at every call, and
+        # one compiled kernel serves any value of them.
+        self._scale_factor_j = jnp.asarray(self.scale_factor, dtype=self.dtype)
+        self._bias_j = jnp.asarray(self.bias, dtype=self.dtype)
+
+    # Pure effect computation, `_predict` binds the hyperparameters to it
+    _predict_pure = staticmethod(_simple_kernel)
+
+    def _transform(self, X: pd.DataFrame, fh: pd.Index) -> jnp.ndarray:
+        """
+        Convert `X` to a JAX array with the default implementation, cast to `dtype`.
+
+        The output has shape (n_series, n_timepoints, n_features), with
+        n_series=1 for a single series.
+        """
+        data = super()._transform(X, fh).astype(self.dtype)
+        return data.reshape((-1, *data.shape[-2:]))
+
+    def _update_data(self, data: Any, arr: jnp.ndarray) -> Any:
+        """
+        Replace the transformed data with a new array, in the layout of `_transform`.
+        """
+        if isinstance(data, jnp.ndarray):
+            arr = jnp.asarray(arr, dtype=self.dtype)
+            return arr.reshape((-1, *arr.shape[-2:]))
+        return super()._update_data(data, arr)
 
     def _predict(
         self,
@@ -148,8 +214,18 @@ class MySimpleEffect(BaseEffect):
         jnp.ndarray
             The computed effect, a JAX array.
         """
-        variable = numpyro.sample("variable", dist.Normal(0.0, 1.0))
-        return data * self.scale_factor + self.bias + variable
+        # One batched draw for all series. The number of series is read from
+        # the (static) shape of `data`, so it is never a traced value.
+        with numpyro.plate("panel_plate", data.shape[0], dim=-1):
+            variable = numpyro.sample("variable", dist.Normal(0.0, 1.0))
+        variable = variable.astype(self.dtype)
+        effect = self._predict_pure(
+            data, self._scale_factor_j, self._bias_j, variable[:, None, None]
+        )
+        if not self.get_tag("capability:panel", False):
+            # Single series: drop the size-1 series axis, as expected by the model
+            effect = effect[0]
+        return effect
 
 
 class MyCustomEffect(BaseEffect):
@@ -169,8 +245,11 @@ class MyCustomEffect(BaseEffect):
     ----------
     multiplier : float
         A multiplier applied in `_predict`.
-    prior_scale : float
-        Scale of the Normal prior for sampling a coefficient.
+    prior : Distribution, optional
+        Prior of the coefficients, sampled once per feature. Defaults to
+        dist.Normal(0, 1).
+    dtype : DTypeLike
+        Floating point type of the transformed data, by default `jnp.float32`.
     """
 
     _tags = {
@@ -182,34 +261,64 @@ class MyCustomEffect(BaseEffect):
         "requires_fit_before_transform": True,  # We need fit to learn the mean
     }
 
-    def __init__(self, multiplier: float = 1.0, prior=None):
+    # Pure effect computation, `_predict` binds the hyperparameters to it
+    _predict_pure = staticmethod(_custom_kernel)
+
+    def __init__(
+        self,
+        multiplier: float = 1.0,
+        prior=None,
+        dtype: DTypeLike = jnp.float32,
+    ):
         # Init hyperparameters before BaseEffect init
         # Do not change them!
         self.multiplier = multiplier
         self.prior = prior
+        self.dtype = dtype
         super().__init__()
         # It's good practice to define priors in __init__
         self._prior = prior if prior is not None else dist.Normal(0.0, 1.0)
+        self._multiplier_j = jnp.asarray(self.multiplier, dtype=self.dtype)
 
     def _fit(self, y: pd.DataFrame, X: Optional[pd.DataFrame], scale: float = 1.0):
         """
         (Optional) Fit phase: called once during forecaster.fit().
 
         This example learns the column means from the training data `X` for centering.
+        The data is uploaded once and the means are computed and kept on the
+        device, so that `_transform` can center new data there without another
+        pass on the host. The cost is holding the (n_features,) mean vector in
+        device memory.
         """
         if X is not None:
-            # Compute and store column means of X for centering in _transform
-            self._X_mean = X.mean()
+            # Compute and store column means of X for centering in _transform.
+            # NaNs are skipped, as pandas' `X.mean()` does. The reduction runs in
+            # at least float32 even for lower precision dtypes, and the mean is
+            # kept in that precision: `_transform` casts to `dtype` only after
+            # centering.
+            acc_dtype = jnp.promote_types(self.dtype, jnp.float32)
+            arr = jnp.asarray(X.to_numpy(dtype=acc_dtype))
+            self._X_mean = jnp.nanmean(
+                arr, axis=tuple(range(arr.ndim - 1))
+            ).block_until_ready()
+            self._columns = X.columns
+            self._n_series = (
+                X.index.droplevel(-1).nunique() if X.index.nlevels > 1 else 1
+            )
+            self._n_features = len(self._columns)
         else:
-            self._X_mean = 0.0
+            self._X_mean = jnp.zeros((), dtype=self.dtype)
+            self._columns = None
+            self._n_series = 1
+            self._n_features = 1
         super()._fit(y, X, scale)
 
     def _transform(self, X: pd.DataFrame, fh: pd.Index) -> Any:
         """
         (Optional) Transform phase: prepares data for `_predict`.
 
-        This example implementation subtracts the stored mean and then converts
-        the data to a JAX array.
+        This example implementation uploads the data as a JAX array and
+        subtracts the mean stored on the device by `_fit`.
 
         The `_transform` method can return one of the following structures:
         - A single `jnp.ndarray`: The simplest and most common case.
@@ -217,11 +326,47 @@ class MyCustomEffect(BaseEffect):
           The first element is typically the main data array.
         - A `dict`: Flexible for passing named arrays and other metadata.
           Must contain a 'data' key holding the main `jnp.ndarray`.
+
+        The returned array always has shape (n_series, n_timepoints, n_features),
+        with n_series=1 for a single series. Since `_predict` sees the same rank
+        during fit and predict, it is traced once and reused, and the shape is
+        checked here, outside of any jitted code.
+        """
+        if self._columns is not None:
+            X = X[self._columns]
+
+        n_series = 1
+        if X.index.nlevels > 1:
+            # Panels are accepted with rows in any order
+            X = X.sort_index()
+            n_series = X.index.droplevel(-1).nunique()
+        if n_series != self._n_series or X.shape[1] != self._n_features:
+            raise ValueError(
+                f"Expected data with {self._n_series} series and "
+                f"{self._n_features} features, got {n_series} series and "
+                f"{X.shape[1]} features"
+            )
+
+        # `series_to_tensor` returns (n_series, n_timepoints, n_features) for a
+        # single series and for panels, with the series in the same order as the
+        # target, and raises if the series have different lengths. The data is then centered on the device with the
+        # mean learned in _fit.
+        arr = series_to_tensor(X) - self._X_mean
+        # Every multiply in `_predict` moves `dtype`-sized elements
+        return arr.astype(self.dtype)
+
+    def _update_data(self, data: Any, arr: jnp.ndarray) -> Any:
+        """
+        Replace the transformed data with a new array.
+
+        `LiftExperimentLikelihood` and budget optimization pass a single series as
+        a (n_timepoints, n_features) array, so it is reshaped to the
+        (n_series, n_timepoints, n_features) layout that `_predict` expects.
         """
-        # Center the data using the mean learned in _fit
-        X_proc = X - self._X_mean
-        # Convert to JAX tensor/array
-        return series_to_tensor_or_array(X_proc)
+        if isinstance(data, jnp.ndarray):
+            arr = jnp.asarray(arr, dtype=self.dtype)
+            return arr.reshape((-1, *arr.shape[-2:]))
+        return super()._update_data(data, arr)
 
     def _predict(
         self,
@@ -242,12 +387,19 @@ class MyCustomEffect(BaseEffect):
         - If `_transform` returns a `tuple`, `data` will be that tuple.
         - If `_transform` returns a `dict`, `data` will be that dictionary.
         """
-        # Sample a coefficient from the prior defined in __init__
-        coef = numpyro.sample("my_custom_coef", self._prior)
+        # Sample one coefficient per feature from the prior defined in __init__
+        with numpyro.plate("features_plate", self._n_features, dim=-1):
+            coef = numpyro.sample("my_custom_coef", self._prior)
+        coef = coef.astype(self.dtype)
 
         # The effect's computation.
         # This example creates a linear effect with the centered data.
-        effect = data * coef * self.multiplier
+        # `data` is always (n_series, n_timepoints, n_features), and the kernel
+        # broadcasts over the series axis, so all series are computed at once.
+        effect = self._predict_pure(data, coef, self._multiplier_j)
+        if not self.get_tag("capability:panel", False):
+            # Single series: drop the size-1 series axis, as expected by the model
+            effect = effect[0]
 
         return effect
 
@@ -256,7 +408,7 @@ class MyCustomEffect(BaseEffect):
         """
         (Optional) Provide test parameters for Prophetverse's testing framework.
         """
-        return [{"multiplier": 2.0, "prior_scale": 1.0}]
+        return [{"multiplier": 2.0}, {"prior": dist.Laplace(0.0, 1.0)}]
 
 
 # --- Advanced: Additive vs Multiplicative Effects ---
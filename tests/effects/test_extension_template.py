@@ -0,0 +1,264 @@
+"""Smoke tests for the effects in extension_templates/effect.py."""
+
+import importlib.util
+from pathlib import Path
+
+import jax.numpy as jnp
+import numpy as np
+import numpyro
+import numpyro.distributions as dist
+import pandas as pd
+import pytest
+from jax.experimental import enable_x64
+from sktime.utils._testing.series import _make_series
+
+from prophetverse.effects import LiftExperimentLikelihood
+from prophetverse.engine import MAPInferenceEngine
+from prophetverse.engine.optimizer import AdamOptimizer
+from prophetverse.sktime.univariate import Prophetverse
+
+from ..sktime._utils import execute_fit_predict_test, make_random_X, make_y
+
+TEMPLATE_PATH = Path(__file__).parents[2] / "extension_templates" / "effect.py"
+
+
+def _load_template():
+    spec = importlib.util.spec_from_file_location("effect_template", TEMPLATE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+template = _load_template()
+
+EFFECT_CLASSES = [template.MySimpleEffect, template.MyCustomEffect]
+
+
+def _make_X(n_timepoints, n_columns=1, random_state=None):
+    X = _make_series(
+        n_timepoints=n_timepoints, n_columns=n_columns, random_state=random_state
+    )
+    if isinstance(X, pd.Series):
+        X = X.to_frame()
+    return X
+
+
+def _make_panel(n_series, n_timepoints, n_columns=1):
+    data = {
+        f"series_{i}": _make_X(
+            n_timepoints=n_timepoints, n_columns=n_columns, random_state=i
+        )
+        for i in range(n_series)
+    }
+    return pd.concat(data, axis=0)
+
+
+def _fit_transform_predict(effect, X):
+    effect.fit(y=X.iloc[:, [0]], X=X, scale=1.0)
+    fh = X.index.get_level_values(-1).unique()
+    data = effect.transform(X, fh=fh)
+    with numpyro.handlers.seed(rng_seed=0):
+        return effect.predict(data=data, predicted_effects={})
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_single_series_output_shape(effect_class):
+    X = _make_X(n_timepoints=20, n_columns=2, random_state=0)
+    out = _fit_transform_predict(effect_class(), X)
+    assert out.shape == (20, 1)
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_broadcasted_panel_output_shape(effect_class):
+    X = _make_panel(n_series=3, n_timepoints=20)
+    out = _fit_transform_predict(effect_class(), X)
+    assert out.shape == (3, 20, 1)
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_panel_capability_output_shape(effect_class):
+    X = _make_panel(n_series=3, n_timepoints=20)
+    effect = effect_class().set_tags(**{"capability:panel": True})
+    out = _fit_transform_predict(effect, X)
+    assert out.shape == (3, 20, 1)
+
+
+def test_custom_effect_raises_on_mismatched_panel():
+    effect = template.MyCustomEffect().set_tags(**{"capability:panel": True})
+    effect.fit(y=None, X=_make_panel(n_series=2, n_timepoints=10), scale=1.0)
+
+    X = _make_panel(n_series=4, n_timepoints=5)
+    with pytest.raises(ValueError, match="series"):
+        effect.transform(X, fh=X.index.get_level_values(-1).unique())
+
+
+def test_custom_effect_raises_on_ragged_panel():
+    effect = template.MyCustomEffect().set_tags(**{"capability:panel": True})
+    X = _make_panel(n_series=2, n_timepoints=10)
+    effect.fit(y=None, X=X, scale=1.0)
+
+    X_ragged = X.drop(X.index[0])
+    with pytest.raises(ValueError, match="has length"):
+        effect.transform(X_ragged, fh=X.index.get_level_values(-1).unique())
+
+
+def test_custom_effect_accepts_panel_rows_in_any_order():
+    effect = template.MyCustomEffect().set_tags(**{"capability:panel": True})
+    X = _make_panel(n_series=3, n_timepoints=10)
+    effect.fit(y=None, X=X, scale=1.0)
+    fh = X.index.get_level_values(-1).unique()
+
+    X_shuffled = X.sample(frac=1.0, random_state=0)
+    np.testing.assert_allclose(
+        effect.transform(X_shuffled, fh=fh), effect.transform(X, fh=fh)
+    )
+
+
+def test_simple_effect_values():
+    X = _make_X(n_timepoints=20, random_state=0)
+    effect = template.MySimpleEffect(scale_factor=2.0, bias=0.5)
+    effect.fit(y=X, X=X, scale=1.0)
+    data = effect.transform(X, fh=X.index)
+
+    with numpyro.handlers.trace() as trace, numpyro.handlers.seed(rng_seed=0):
+        out = effect.predict(data=data, predicted_effects={})
+
+    variable = trace["variable"]["value"]
+    expected = X.to_numpy() * 2.0 + 0.5 + variable
+    np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+
+def test_custom_effect_values():
+    X = _make_X(n_timepoints=20, random_state=0)
+    effect = template.MyCustomEffect(multiplier=3.0, prior=dist.Delta(2.0))
+    effect.fit(y=X, X=X, scale=1.0)
+    data = effect.transform(X, fh=X.index)
+
+    with numpyro.handlers.seed(rng_seed=0):
+        out = effect.predict(data=data, predicted_effects={})
+
+    expected = (X - X.mean()).to_numpy() * 2.0 * 3.0
+    np.testing.assert_allclose(out, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_custom_effect_panel_matches_per_series_values():
+    X = _make_panel(n_series=3, n_timepoints=10)
+    effect = template.MyCustomEffect(multiplier=3.0, prior=dist.Delta(2.0))
+    effect.set_tags(**{"capability:panel": True})
+    effect.fit(y=None, X=X, scale=1.0)
+    data = effect.transform(X, fh=X.index.get_level_values(-1).unique())
+
+    with numpyro.handlers.seed(rng_seed=0):
+        out = effect.predict(data=data, predicted_effects={})
+
+    centered = X - X.mean()
+    for i, series in enumerate(X.index.droplevel(-1).unique()):
+        expected = centered.loc[series].to_numpy() * 2.0 * 3.0
+        np.testing.assert_allclose(out[i], expected, rtol=1e-5, atol=1e-5)
+
+
+def test_custom_effect_mean_is_not_reduced_in_low_precision():
+    X = _make_X(n_timepoints=20, random_state=0) + 1000.0
+    effect = template.MyCustomEffect(dtype=jnp.bfloat16)
+    effect.fit(y=None, X=X, scale=1.0)
+    np.testing.assert_allclose(effect._X_mean, X.mean().to_numpy(), rtol=1e-6)
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_bfloat16_dtype_flows_through_transform_and_predict(effect_class):
+    X = _make_X(n_timepoints=20, random_state=0)
+    effect = effect_class(dtype=jnp.bfloat16)
+    effect.fit(y=X, X=X, scale=1.0)
+    data = effect.transform(X, fh=X.index)
+    assert data.dtype == jnp.bfloat16
+
+    with numpyro.handlers.seed(rng_seed=0):
+        out = effect.predict(data=data, predicted_effects={})
+    assert out.dtype == jnp.bfloat16
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_float64_dtype_flows_through_transform_and_predict(effect_class):
+    X = _make_X(n_timepoints=20, random_state=0) + 1000.0
+    with enable_x64():
+        effect = effect_class(dtype=jnp.float64)
+        effect.fit(y=X, X=X, scale=1.0)
+        data = effect.transform(X, fh=X.index)
+        assert data.dtype == jnp.float64
+
+        with numpyro.handlers.seed(rng_seed=0):
+            out = effect.predict(data=data, predicted_effects={})
+        assert out.dtype == jnp.float64
+
+    if effect_class is template.MyCustomEffect:
+        # Centering is done in full precision, not truncated to float32
+        np.testing.assert_allclose(
+            data[0], (X - X.mean()).to_numpy(), rtol=1e-12, atol=1e-12
+        )
+
+
+def test_custom_effect_ignores_nan_in_mean():
+    X = _make_X(n_timepoints=20, random_state=0)
+    X.iloc[0, 0] = np.nan
+    effect = template.MyCustomEffect()
+    effect.fit(y=None, X=X, scale=1.0)
+    assert np.isfinite(np.asarray(effect._X_mean)).all()
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("hierarchy_levels", [(1,), (2,)])
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_prophetverse_fit_predict(effect_class, hierarchy_levels):
+    y = make_y(hierarchy_levels)
+    X = make_random_X(y)
+    forecaster = Prophetverse(
+        exogenous_effects=[("template_effect", effect_class(), r"x1")],
+        inference_engine=MAPInferenceEngine(
+            optimizer=AdamOptimizer(), num_steps=1, num_samples=1
+        ),
+    )
+
+    execute_fit_predict_test(forecaster, y, X, test_size=4)
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_lift_experiment_likelihood_with_template_effect(effect_class):
+    X = pd.DataFrame(
+        data={"exog": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]},
+        index=pd.date_range("2021-01-01", periods=6),
+    )
+    lift_test_results = pd.DataFrame(
+        index=X.index[:2], data={"x_start": [1, 2], "x_end": [10, 20], "lift": [2, 4]}
+    )
+    effect = LiftExperimentLikelihood(
+        effect=effect_class(), lift_test_results=lift_test_results, prior_scale=1.0
+    )
+    effect.fit(X=X, y=X, scale=1.0)
+    data = effect.transform(X=X, fh=X.index)
+
+    exec_trace = numpyro.handlers.trace(
+        numpyro.handlers.seed(effect.predict, rng_seed=0)
+    ).get_trace(data=data, predicted_effects={})
+
+    assert exec_trace["lift_experiment:ignore"]["value"].shape == (2, 1)
+    with numpyro.handlers.seed(rng_seed=0):
+        out = effect.predict(data=data, predicted_effects={})
+    assert out.shape == (6, 1)
+
+
+@pytest.mark.parametrize("effect_class", EFFECT_CLASSES)
+def test_update_data_keeps_layout(effect_class):
+    X = _make_X(n_timepoints=20, random_state=0)
+    effect = effect_class()
+    effect.fit(y=X, X=X, scale=1.0)
+    data = effect.transform(X, fh=X.index)
+
+    new_data = effect._update_data(data, jnp.ones((20, 1)))
+    assert new_data.shape == data.shape
+
+    with numpyro.handlers.trace() as trace, numpyro.handlers.seed(rng_seed=0):
+        out = effect.predict(data=new_data, predicted_effects={})
+    assert out.shape == (20, 1)
+    for site in trace.values():
+        if site["type"] == "sample":
+            assert site["value"].shape == (1,)